@@ -52,6 +52,15 @@ from landscape.lib.compat import _PY3
 from landscape.lib.twisted_util import gather_results
 
 
+NOT_HANDLED_RESULT_TEXT = """\
+Landscape client failed to handle this request ({}) because the
+plugin which should handle it isn't available.  This could mean that the
+plugin has been intentionally disabled, or that the client isn't running
+properly, or you may be running an older version of the client that doesn't
+support this feature.
+"""
+
+
 def event(method):
     """Turns a L{BrokerServer} method into an event broadcaster.
 
@@ -379,28 +388,15 @@ class BrokerServer:
         indicating as such.
         """
         opid = message.get("operation-id")
-        if (
-            True not in results
-            and opid is not None
-            and message["type"] != "resynchronize"
-        ):
-
+        if opid is None or message["type"] == "resynchronize":
+            return
+        if True not in results:
             mtype = message["type"]
             logging.error(f"Nobody handled the {mtype} message.")
-
-            result_text = """\
-Landscape client failed to handle this request ({}) because the
-plugin which should handle it isn't available.  This could mean that the
-plugin has been intentionally disabled, or that the client isn't running
-properly, or you may be running an older version of the client that doesn't
-support this feature.
-""".format(
-                mtype,
-            )
             response = {
                 "type": "operation-result",
                 "status": FAILED,
-                "result-text": result_text,
+                "result-text": NOT_HANDLED_RESULT_TEXT.format(mtype),
                 "operation-id": opid,
             }
             self._exchanger.send(response, urgent=True)
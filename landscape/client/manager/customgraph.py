@@ -2,10 +2,8 @@ import logging
 import os
 import time
 
-from twisted.internet.defer import DeferredList
 from twisted.internet.defer import fail
 from twisted.internet.defer import succeed
-from twisted.python.compat import iteritems
 
 from landscape.client.accumulate import Accumulator
 from landscape.client.manager.plugin import ManagerPlugin
@@ -14,7 +12,9 @@ from landscape.client.manager.scriptexecution import (
     ProcessTimeLimitReachedError,
 )
 from landscape.client.manager.scriptexecution import ScriptRunnerMixin
+from landscape.lib.log import log_failure
 from landscape.lib.scriptcontent import generate_script_hash
+from landscape.lib.twisted_util import gather_results
 from landscape.lib.user import get_user_info
 from landscape.lib.user import UnknownUserError
 
@@ -129,8 +129,10 @@ class CustomGraphPlugin(ManagerPlugin, ScriptRunnerMixin):
         scripts_directory = os.path.join(data_path, "custom-graph-scripts")
         filename = os.path.join(scripts_directory, f"graph-{graph_id:d}")
 
-        if os.path.exists(filename):
+        try:
             os.unlink(filename)
+        except FileNotFoundError:
+            pass
 
         try:
             uid, gid = get_user_info(user)[:2]
@@ -178,15 +180,17 @@ class CustomGraphPlugin(ManagerPlugin, ScriptRunnerMixin):
 
         message = {"type": self.message_type, "data": self._data}
 
-        new_data = {}
-        for graph_id, item in iteritems(self._data):
-            script_hash = item["script-hash"]
-            new_data[graph_id] = {
+        # Start afresh with new entries rather than clearing the current ones
+        # in place: the message still references them, and the broker proxy
+        # may hold on to it to resend after a reconnection.
+        self._data = {
+            graph_id: {
                 "values": [],
                 "error": "",
-                "script-hash": script_hash,
+                "script-hash": item["script-hash"],
             }
-        self._data = new_data
+            for graph_id, item in self._data.items()
+        }
 
         self.registry.broker.send_message(
             message,
@@ -229,6 +233,9 @@ class CustomGraphPlugin(ManagerPlugin, ScriptRunnerMixin):
                 failure.value,
             )
 
+    def _log_graph_failure(self, failure, graph_id):
+        log_failure(failure, msg=f"Error running custom graph {graph_id}")
+
     def _get_script_hash(self, filename):
         with open(filename) as file_object:
             script_content = file_object.read()
@@ -255,6 +262,8 @@ class CustomGraphPlugin(ManagerPlugin, ScriptRunnerMixin):
     def _continue_run(self, graphs):
         deferred_list = []
         now = int(self._create_time())
+        # Graphs commonly share users, only look each of them up once per run.
+        user_infos = {}
 
         for graph_id, filename, user in graphs:
             if os.path.isfile(filename):
@@ -270,15 +279,19 @@ class CustomGraphPlugin(ManagerPlugin, ScriptRunnerMixin):
             else:
                 self._data[graph_id]["script-hash"] = script_hash
             try:
-                uid, gid, path = get_user_info(user)
+                if user not in user_infos:
+                    user_infos[user] = get_user_info(user)
+                uid, gid, path = user_infos[user]
             except UnknownUserError as e:
                 d = fail(e)
                 d.addErrback(self._handle_error, graph_id)
+                d.addErrback(self._log_graph_failure, graph_id)
                 deferred_list.append(d)
                 continue
             if not self.is_user_allowed(user):
                 d = fail(ProhibitedUserError(user))
                 d.addErrback(self._handle_error, graph_id)
+                d.addErrback(self._log_graph_failure, graph_id)
                 deferred_list.append(d)
                 continue
             if not os.path.isfile(filename):
@@ -293,5 +306,6 @@ class CustomGraphPlugin(ManagerPlugin, ScriptRunnerMixin):
             )
             result.addCallback(self._handle_data, graph_id, now)
             result.addErrback(self._handle_error, graph_id)
+            result.addErrback(self._log_graph_failure, graph_id)
             deferred_list.append(result)
-        return DeferredList(deferred_list)
+        return gather_results(deferred_list, consume_errors=True)
@@ -358,8 +358,7 @@ class ProcessAccumulationProtocol(ProcessProtocol):
     """
 
     def __init__(self, reactor, size_limit, truncation_indicator=""):
-        self.data = []
-        self._size = 0
+        self.data = bytearray()
         self.result_deferred = Deferred()
         self._cancelled = False
         self.size_limit = size_limit * 1024
@@ -381,15 +380,15 @@ class ProcessAccumulationProtocol(ProcessProtocol):
         Add it to our buffer, as long as it doesn't go over L{size_limit}
         bytes.
         """
-        if self._size < self.size_limit:
-            data_length = len(data)
-            if (self._size + data_length) >= self._truncated_size_limit:
-                extent = self._truncated_size_limit - self._size
-                self.data.append(data[:extent] + self._truncation_indicator)
-                self._size = self.size_limit
+        size = len(self.data)
+        if size < self.size_limit:
+            if (size + len(data)) >= self._truncated_size_limit:
+                # This brings the buffer to exactly size_limit bytes, so no
+                # more data will be accepted.
+                self.data += data[: self._truncated_size_limit - size]
+                self.data += self._truncation_indicator
             else:
-                self.data.append(data)
-                self._size += data_length
+                self.data += data
 
     def processEnded(self, reason):  # noqa: N802
         """Fire back the deferred.
@@ -403,7 +402,7 @@ class ProcessAccumulationProtocol(ProcessProtocol):
         # We get bytes with self.data, but want unicode with replace
         # characters. This is again attempted in
         # ScriptExecutionPlugin._respond, but it is not called in all cases.
-        data = b"".join(self.data).decode("utf-8", "replace")
+        data = self.data.decode("utf-8", "replace")
         if self._cancelled:
             self.result_deferred.errback(ProcessTimeLimitReachedError(data))
         else:
@@ -440,6 +440,37 @@ class CustomGraphManagerTests(LandscapeTest):
 
         return result
 
+    @mock.patch("pwd.getpwnam")
+    def test_run_user_looked_up_once(self, mock_getpwnam):
+        """
+        When several graphs are run as the same user, the user is only
+        looked up once per run.
+        """
+        filename1 = self.makeFile("some content")
+        self.store.add_graph(123, filename1, "bar")
+        filename2 = self.makeFile("some other content")
+        self.store.add_graph(124, filename2, "bar")
+        factory = StubProcessFactory()
+        self.graph_manager.process_factory = factory
+
+        class PwNam:
+            pw_uid = 1234
+            pw_gid = 5678
+            pw_dir = self.makeFile()
+
+        mock_getpwnam.return_value = PwNam
+
+        result = self.graph_manager.run()
+
+        self.assertEqual(len(factory.spawns), 2)
+        mock_getpwnam.assert_called_once_with("bar")
+        for spawn in factory.spawns:
+            self.assertEqual(spawn[5], 1234)
+            self.assertEqual(spawn[6], 5678)
+            self._exit_process_protocol(spawn[0], b"spam")
+
+        return result
+
     def test_run_dissallowed_user(self):
         uid = os.getuid()
         info = pwd.getpwuid(uid)
@@ -512,6 +543,27 @@ class CustomGraphManagerTests(LandscapeTest):
 
         return result.addCallback(check)
 
+    @mock.patch("pwd.getpwnam")
+    def test_run_logs_unhandled_failure(self, mock_getpwnam):
+        """
+        A failure that escapes the per-graph error handling is logged, and
+        doesn't stop the run from completing.
+        """
+        self.log_helper.ignore_errors(ZeroDivisionError)
+        mock_getpwnam.side_effect = KeyError("foo")
+        self.manager.config.script_users = "foo"
+        self.store.add_graph(123, "filename", "foo")
+        self.graph_manager._handle_error = lambda failure, graph_id: 1 / 0
+
+        def check(ignore):
+            self.assertIn(
+                "Error running custom graph 123",
+                self.logfile.getvalue(),
+            )
+            self.assertIn("ZeroDivisionError", self.logfile.getvalue())
+
+        return self.graph_manager.run().addCallback(check)
+
     def test_run_timeout(self):
         filename = self.makeFile("some content")
         self.store.add_graph(123, filename, None)
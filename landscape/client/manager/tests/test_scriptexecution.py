@@ -3,6 +3,7 @@ import pwd
 import stat
 import sys
 import tempfile
+from pathlib import Path
 from unittest import mock
 
 from twisted.internet.defer import fail
@@ -816,8 +817,8 @@ class ScriptExecutionMessageTests(LandscapeTest):
         Given spawnProcess arguments, check to make sure that the temporary
         script has the correct content.
         """
-        data = open(executable, "r").read()
-        self.assertEqual(data, f"#!{interp}\n{code}")
+        data = Path(executable).read_bytes()
+        self.assertEqual(data, f"#!{interp}\n{code}".encode("utf-8"))
 
     def _send_script(
         self,
@@ -947,7 +948,7 @@ class ScriptExecutionMessageTests(LandscapeTest):
             uid,
             gid,
         ):
-            protocol.childDataReceived(1, "hi!\n")
+            protocol.childDataReceived(1, b"hi!\n")
             protocol.processEnded(Failure(ProcessDone(0)))
             self._verify_script(filename, sys.executable, "print 'hi'")
 
@@ -33,18 +33,25 @@ class AptPreferences(DataWatcher):
             self._etc_apt_directory,
             "preferences",
         )
-        if os.path.exists(preferences_filename):
+        try:
             data[preferences_filename] = read_text_file(preferences_filename)
+        except FileNotFoundError:
+            pass
 
         preferences_directory = os.path.join(
             self._etc_apt_directory,
             "preferences.d",
         )
-        if os.path.isdir(preferences_directory):
-            for entry in os.listdir(preferences_directory):
-                filename = os.path.join(preferences_directory, entry)
-                if os.path.isfile(filename):
-                    data[filename] = read_text_file(filename)
+        try:
+            entries = os.scandir(preferences_directory)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        else:
+            with entries:
+                for entry in entries:
+                    # Like os.path.isfile, this follows symlinks.
+                    if entry.is_file():
+                        data[entry.path] = read_text_file(entry.path)
 
         if data == {}:
             return None
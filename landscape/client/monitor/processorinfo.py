@@ -6,6 +6,18 @@ from landscape.client.monitor.plugin import MonitorPlugin
 from landscape.lib.plugin import PluginConfigError
 
 
+# Match only the "key : value" lines the parsers below care about, so that the
+# rest of /proc/cpuinfo is skipped in a single regex pass over the file. The
+# patterns start with a literal newline rather than using re.M and "^", which
+# lets the regex engine jump between line starts instead of trying to match at
+# every position, so the content they are applied to must start with one.
+_PPC_FIELDS_RE = re.compile(r"\n(processor|cpu)[ \t]*:[ \t]*([^\n]*)")
+_X86_FIELDS_RE = re.compile(
+    r"\n(processor|vendor_id|model name|cache size)[ \t]*:[ \t]*([^\n]*)",
+)
+_RISCV_FIELDS_RE = re.compile(r"\n(processor|isa|uarch)[ \t]*:[ \t]*([^\n]*)")
+
+
 class ProcessorInfo(MonitorPlugin):
     """Plugin captures information about the processor(s) in this machine.
 
@@ -149,22 +161,20 @@ class PowerPCMessageFactory:
     def create_message(self):
         """Returns a list containing information about each processor."""
         processors = []
-        file = open(self._source_filename)
+        current = None
 
-        try:
-            current = None
+        with open(self._source_filename) as file:
+            content = "\n" + file.read()
 
-            for line in file:
-                parts = line.split(":", 1)
-                key = parts[0].strip()
+        for match in _PPC_FIELDS_RE.finditer(content):
+            key, value = match.groups()
+            value = value.rstrip()
 
-                if key == "processor":
-                    current = {"processor-id": int(parts[1].strip())}
-                    processors.append(current)
-                elif key == "cpu":
-                    current["model"] = parts[1].strip()
-        finally:
-            file.close()
+            if key == "processor":
+                current = {"processor-id": int(value)}
+                processors.append(current)
+            else:
+                current["model"] = value
 
         return processors
 
@@ -241,11 +251,11 @@ class SparcMessageFactory:
             regexp = re.compile(r"CPU(\d{1})+")
 
             for line in file:
-                parts = line.split(":", 1)
-                key = parts[0].strip()
+                key, _, value = line.partition(":")
+                key = key.strip()
 
                 if key == "cpu":
-                    model = parts[1].strip()
+                    model = value.strip()
                 elif regexp.match(key):
                     start, end = re.compile(r"\d+").search(key).span()
                     message = {
@@ -271,27 +281,24 @@ class X86MessageFactory:
     def create_message(self):
         """Returns a list containing information about each processor."""
         processors = []
-        file = open(self._source_filename)
-
-        try:
-            current = None
-
-            for line in file:
-                parts = line.split(":", 1)
-                key = parts[0].strip()
-
-                if key == "processor":
-                    current = {"processor-id": int(parts[1].strip())}
-                    processors.append(current)
-                elif key == "vendor_id":
-                    current["vendor"] = parts[1].strip()
-                elif key == "model name":
-                    current["model"] = parts[1].strip()
-                elif key == "cache size":
-                    value_parts = parts[1].split()
-                    current["cache-size"] = int(value_parts[0].strip())
-        finally:
-            file.close()
+        current = None
+
+        with open(self._source_filename) as file:
+            content = "\n" + file.read()
+
+        for match in _X86_FIELDS_RE.finditer(content):
+            key, value = match.groups()
+            value = value.rstrip()
+
+            if key == "processor":
+                current = {"processor-id": int(value)}
+                processors.append(current)
+            elif key == "vendor_id":
+                current["vendor"] = value
+            elif key == "model name":
+                current["model"] = value
+            else:
+                current["cache-size"] = int(value.split()[0])
 
         return processors
 
@@ -316,22 +323,22 @@ class S390XMessageFactory:
             current = None
 
             for line in file:
-                parts = line.split(":", 1)
-                key = parts[0].strip()
+                key, _, value = line.partition(":")
+                key = key.strip()
 
                 if key == "vendor_id":
-                    vendor = parts[1].strip()
+                    vendor = value.strip()
                     continue
 
                 if key.startswith("cache"):
-                    for word in parts[1].split():
+                    for word in value.split():
                         if word.startswith("size="):
                             cache_size = int(word[5:-1])
                             continue
 
                 if key.startswith("processor "):
                     id = int(key.split()[1])
-                    model = parts[1].split()[-1]
+                    model = value.split()[-1]
                     current = {
                         "processor-id": id,
                         "model": model,
@@ -358,28 +365,25 @@ class RISCVMessageFactory:
     def create_message(self):
         """Returns a list containing information about each processor."""
         processors = []
-        file = open(self._source_filename)
+        current = None
         logging.info("Entered RISCVMessageFactory")
 
-        try:
-            current = None
-
-            for line in file:
-                parts = line.split(":", 1)
-                key = parts[0].strip()
+        with open(self._source_filename) as file:
+            content = "\n" + file.read()
 
-                if key == "processor":
-                    current = {"processor-id": int(parts[1].strip())}
-                    # A placeholder in case there is no model provided.
-                    current["model"] = "riscv"
-                    processors.append(current)
-                elif key == "isa":
-                    current["vendor"] = parts[1].strip()
-                elif key == "uarch":
-                    current["model"] = parts[1].strip()
+        for match in _RISCV_FIELDS_RE.finditer(content):
+            key, value = match.groups()
+            value = value.rstrip()
 
-        finally:
-            file.close()
+            if key == "processor":
+                current = {"processor-id": int(value)}
+                # A placeholder in case there is no model provided.
+                current["model"] = "riscv"
+                processors.append(current)
+            elif key == "isa":
+                current["vendor"] = value
+            else:
+                current["model"] = value
 
         logging.info("RISC-V processor info collected:")
         logging.info(processors)
@@ -1039,7 +1039,7 @@ class PluginManagerIntegrationTest(LandscapeTest):
         the /proc/<pid>/stat file.
         """
         stat_data = (
-            "1 Process S 1 0 0 0 0 0 0 0 "
+            "1 (Process) S 1 0 0 0 0 0 0 0 "
             "0 0 20 20 0 0 0 0 0 0 3000 0 "
             "0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0"
         )
@@ -1087,7 +1087,7 @@ class PluginManagerIntegrationTest(LandscapeTest):
         """
 
         stat_data = (
-            "1 Process S 1 0 0 0 0 0 0 0 "
+            "1 (Process) S 1 0 0 0 0 0 0 0 "
             "0 0 500 500 0 0 0 0 0 0 3000 0 "
             "0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0"
         )
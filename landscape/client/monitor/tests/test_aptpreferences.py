@@ -69,6 +69,22 @@ class AptPreferencesTest(LandscapeTest):
             {filename1: "foo", filename2: "bar"},
         )
 
+    def test_get_data_with_preferences_directory_skips_directories(self):
+        """
+        L{AptPreferences.get_data} ignores directories in the APT preferences
+        directory, but follows symlinks to files.
+        """
+        preferences_directory = os.path.join(
+            self.etc_apt_directory,
+            "preferences.d",
+        )
+        self.makeDir(path=preferences_directory)
+        self.makeDir(dirname=preferences_directory)
+        filename = self.makeFile(content="foo")
+        link = os.path.join(preferences_directory, "link")
+        os.symlink(filename, link)
+        self.assertEqual(self.plugin.get_data(), {link: "foo"})
+
     def test_get_data_with_one_big_file(self):
         """
         L{AptPreferences.get_data} truncates the contents of an APT preferences
@@ -112,6 +128,30 @@ class AptPreferencesTest(LandscapeTest):
             },
         )
 
+    def test_get_data_same_size_rewrite_is_read_again(self):
+        """
+        L{AptPreferences.get_data} picks up a preferences file rewritten in
+        place with contents of the same size, even if its modification time
+        is restored.
+        """
+        preferences_filename = os.path.join(
+            self.etc_apt_directory,
+            "preferences",
+        )
+        self.makeFile(path=preferences_filename, content="crap")
+        stat = os.stat(preferences_filename)
+        self.plugin.get_data()
+        with open(preferences_filename, "w") as fd:
+            fd.write("junk")
+        os.utime(
+            preferences_filename,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns),
+        )
+        self.assertEqual(
+            self.plugin.get_data(),
+            {preferences_filename: "junk"},
+        )
+
     def test_exchange_without_apt_preferences_data(self):
         """
         If the system has no APT preferences data, no message is sent.
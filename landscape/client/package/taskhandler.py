@@ -3,6 +3,7 @@ import os
 import re
 
 from twisted.internet.defer import Deferred
+from twisted.internet.defer import inlineCallbacks
 from twisted.internet.defer import maybeDeferred
 from twisted.internet.defer import succeed
 
@@ -119,41 +120,35 @@ class PackageTaskHandler:
     def run(self):
         return self.handle_tasks()
 
+    @inlineCallbacks
     def handle_tasks(self):
         """Handle the tasks in the queue.
 
         The tasks will be handed over one by one to L{handle_task} until the
         queue is empty or a task fails.
 
+        This is a plain loop rather than a chain of callbacks, so that a long
+        queue doesn't build a Deferred chain that is as deep as the queue.
+
         @see: L{handle_tasks}
         """
-        return self._handle_next_task(None)
-
-    def _handle_next_task(self, result, last_task=None):
-        """Pick the next task from the queue and pass it to C{handle_task}."""
-
-        if last_task is not None:
-            # Last task succeeded.  We can safely kill it now.
-            last_task.remove()
-            self._count += 1
-
-        task = self._store.get_next_task(self.queue_name)
+        while True:
+            task = self._store.get_next_task(self.queue_name)
+            if not task:
+                # No more tasks!  We're done!
+                return
 
-        if task:
             self._decode_task_type(task)
-            # We have another task.  Let's handle it.
-            result = maybeDeferred(self.handle_task, task)
-            result.addCallback(self._handle_next_task, last_task=task)
-            result.addErrback(self._handle_task_failure)
-            return result
-
-        else:
-            # No more tasks!  We're done!
-            return succeed(None)
+            try:
+                yield maybeDeferred(self.handle_task, task)
+            except PackageTaskError:
+                # Gracefully stop handling tasks, leaving the failed one in
+                # the queue.
+                return
 
-    def _handle_task_failure(self, failure):
-        """Gracefully handle a L{PackageTaskError} and stop handling tasks."""
-        failure.trap(PackageTaskError)
+            # The task succeeded.  We can safely kill it now.
+            task.remove()
+            self._count += 1
 
     def handle_task(self, task):
         """Handle a single task.
@@ -281,8 +276,11 @@ def run_task_handler(cls, args, reactor=None):
     config.load(args)
 
     for directory in [config.package_directory, config.hash_id_directory]:
-        if not os.path.isdir(directory):
+        try:
             os.mkdir(directory)
+        except FileExistsError:
+            if not os.path.isdir(directory):
+                raise
 
     program_name = cls.queue_name
     lock_filename = os.path.join(
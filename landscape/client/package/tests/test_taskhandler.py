@@ -290,7 +290,7 @@ class PackageTaskHandlerTest(LandscapeTest):
 
         results[0].callback(None)
         self.assertEqual(stash, [0, 1])
-        self.assertTrue(handle_tasks_result.called)
+        self.assertFalse(handle_tasks_result.called)
         self.assertEqual(self.store.get_next_task(queue_name).data, 2)
 
         results[2].callback(None)
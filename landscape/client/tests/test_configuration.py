@@ -48,6 +48,7 @@ from landscape.lib.compat import StringIO
 from landscape.lib.fetch import HTTPCodeError
 from landscape.lib.fetch import PyCurlError
 from landscape.lib.fs import read_binary_file
+from landscape.lib.fs import read_text_file
 from landscape.lib.persist import Persist
 from landscape.lib.testing import EnvironSaverHelper
 
@@ -760,7 +761,7 @@ class ConfigurationFunctionsTest(LandscapeConfigurationTest):
         try:
             config.config = config_file
             config.write()
-            return open(config.config).read().strip() + "\n"
+            return read_text_file(config.config).strip() + "\n"
         finally:
             config.config = original_config
 
@@ -2139,7 +2140,7 @@ registration_key = shared-secret
         mock_print_text.assert_called_once_with(
             f"Writing SSL CA certificate to {key_filename}...",
         )
-        self.assertEqual("Hi there!", open(key_filename).read())
+        self.assertEqual("Hi there!", read_text_file(key_filename))
 
         options = ConfigParser()
         options.read(config_filename)
@@ -340,7 +340,7 @@ class PackageStore(HashIdStore):
     def get_next_task(self, cursor, queue):
         cursor.execute(
             "SELECT id, queue, timestamp, data FROM task "
-            "WHERE queue=? ORDER BY timestamp",
+            "WHERE queue=? ORDER BY timestamp LIMIT 1",
             (queue,),
         )
         row = cursor.fetchone()
@@ -513,6 +513,20 @@ def ensure_package_schema(db):
             " (id INTEGER PRIMARY KEY, queue TEXT,"
             " timestamp TIMESTAMP, data BLOB)",
         )
+    except sqlite3.OperationalError:
+        db.rollback()
+    else:
+        db.commit()
+    # Databases created before this index existed will already have all the
+    # tables above, so the index is created on its own. It lets
+    # get_next_task seek straight to the oldest task of a queue. Like the
+    # tables, it may be created concurrently by another process, or the task
+    # table may not be visible yet, so failures are ignored here too.
+    try:
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS task_queue_timestamp"
+            " ON task (queue, timestamp)",
+        )
     except sqlite3.OperationalError:
         cursor.close()
         db.rollback()
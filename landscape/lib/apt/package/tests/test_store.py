@@ -5,6 +5,7 @@ import unittest
 from unittest import mock
 
 from landscape.lib import testing
+from landscape.lib.apt.package.store import ensure_package_schema
 from landscape.lib.apt.package.store import HashIdStore
 from landscape.lib.apt.package.store import InvalidHashIdDb
 from landscape.lib.apt.package.store import PackageStore
@@ -379,6 +380,58 @@ class PackageStoreTest(BaseTestCase):
         result = cursor.fetchall()
         self.assertTrue(len(result) > 0)
 
+    def test_ensure_package_schema_adds_task_index(self):
+        """
+        The L{ensure_package_schema} function adds the task index to an
+        existing database that doesn't have it yet, and L{get_next_task}
+        still returns the oldest task of the queue.
+        """
+        with mock.patch("time.time", return_value=222):
+            self.store1.add_task("reporter", [1])
+        with mock.patch("time.time", return_value=111):
+            self.store1.add_task("reporter", [2])
+        database = sqlite3.connect(self.filename)
+        database.execute("DROP INDEX task_queue_timestamp")
+        database.commit()
+        database.close()
+
+        store = PackageStore(self.filename)
+        task = store.get_next_task("reporter")
+        self.assertEqual(111, task.timestamp)
+        self.assertEqual([2], task.data)
+
+        database = sqlite3.connect(self.filename)
+        cursor = database.cursor()
+        cursor.execute(
+            "SELECT name FROM sqlite_master"
+            " WHERE type='index' AND tbl_name='task'",
+        )
+        self.assertEqual([("task_queue_timestamp",)], cursor.fetchall())
+        database.close()
+
+    def test_ensure_package_schema_with_locked_database(self):
+        """
+        The L{ensure_package_schema} function doesn't fail if another process
+        holds the write lock on the database while it runs, even if the task
+        index still has to be created.
+        """
+        filename = self.makeFile()
+        database = sqlite3.connect(filename)
+        ensure_package_schema(database)
+        database.execute("DROP INDEX task_queue_timestamp")
+        database.commit()
+        database.close()
+
+        locker = sqlite3.connect(filename)
+        locker.execute("BEGIN IMMEDIATE")
+        try:
+            database = sqlite3.connect(filename, timeout=0)
+            ensure_package_schema(database)
+            database.close()
+        finally:
+            locker.rollback()
+            locker.close()
+
     def test_add_and_get_locked(self):
         """
         L{PackageStore.add_locked} adds the given ids to the table of locked
@@ -77,32 +77,44 @@ def dumps_float(obj):
 
 
 def dumps_bytes(obj):
-    return (f"s{len(obj):d}:").encode("utf-8") + obj
+    return b"s%d:%s" % (len(obj), obj)
 
 
 def dumps_unicode(obj):
     bobj = obj.encode("utf-8")
-    return (f"u{len(bobj):d}:{obj}").encode("utf-8")
+    return b"u%d:%s" % (len(bobj), bobj)
+
+
+# The container dumpers below collect the opening and closing markers in the
+# same list as the serialized items, so that each level of nesting is joined
+# with a single copy of its payload.
 
 
 def dumps_list(obj, _dt=dumps_table):
-    return b"l" + b"".join([_dt[type(val)](val) for val in obj]) + b";"
+    res = [b"l"]
+    res.extend([_dt[type(val)](val) for val in obj])
+    res.append(b";")
+    return b"".join(res)
 
 
 def dumps_tuple(obj, _dt=dumps_table):
-    return b"t" + b"".join([_dt[type(val)](val) for val in obj]) + b";"
+    res = [b"t"]
+    res.extend([_dt[type(val)](val) for val in obj])
+    res.append(b";")
+    return b"".join(res)
 
 
 def dumps_dict(obj, _dt=dumps_table):
     keys = list(obj.keys())
     keys.sort()
-    res = []
+    res = [b"d"]
     append = res.append
     for key in keys:
         val = obj[key]
         append(_dt[type(key)](key))
         append(_dt[type(val)](val))
-    return b"d" + b"".join(res) + b";"
+    append(b";")
+    return b"".join(res)
 
 
 def dumps_none(obj):
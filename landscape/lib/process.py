@@ -1,11 +1,27 @@
 import logging
 import os
-from datetime import datetime
-from datetime import timedelta
+import re
+from functools import partial
 
 from landscape.lib import sysstats
 from landscape.lib.jiffies import detect_jiffies
-from landscape.lib.timestamp import to_timestamp
+
+
+# Only a handful of the fields in /proc/<pid>/status are of interest, so
+# rather than splitting every line we pull them all out in a single scan.
+_STATUS_RE = re.compile(
+    rb"^(Name|State|Uid|Gid|VmSize):[ \t]+([^\n]*)",
+    re.M,
+)
+
+# Pick utime, stime and starttime (fields 14, 15 and 22 in proc(5)) out of
+# /proc/<pid>/stat. The command name is enclosed in parentheses and may
+# itself contain spaces, so matching starts at the last ")".
+_STAT_RE = re.compile(
+    rb"\) (?:[^ ]+ ){11}([^ ]+) ([^ ]+) (?:[^ ]+ ){6}([^ ]+)",
+)
+
+_LUCID_TRACING_STOP = b"T (tracing stop)"
 
 
 class ProcessInformation:
@@ -27,7 +43,9 @@ class ProcessInformation:
         if boot_time is None:
             boot_time = sysstats.BootTimes().get_last_boot_time()
         if boot_time is not None:
-            boot_time = datetime.utcfromtimestamp(boot_time)
+            # Start times are reported in whole seconds, so there's no need
+            # to go through datetime arithmetic for every process.
+            boot_time = int(boot_time)
         self._boot_time = boot_time
         self._proc_dir = proc_dir
         self._jiffies_per_sec = jiffies or detect_jiffies()
@@ -35,14 +53,18 @@ class ProcessInformation:
 
     def get_all_process_info(self):
         """Get process information for all processes on the system."""
-        for filename in os.listdir(self._proc_dir):
-            try:
-                process_id = int(filename)
-            except ValueError:
-                continue
-            process_info = self.get_process_info(process_id)
-            if process_info:
-                yield process_info
+        # All the processes are looked at within the same scan, so there's
+        # no need to read the uptime again for each of them.
+        uptime = self._uptime or sysstats.get_uptime()
+        # Scan by path, so that every scan gets its own directory stream and
+        # overlapping scans don't steal entries from each other.
+        with os.scandir(self._proc_dir) as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                process_info = self._get_process_info(int(entry.name), uptime)
+                if process_info:
+                    yield process_info
 
     def get_process_info(self, process_id):
         """
@@ -52,92 +74,91 @@ class ProcessInformation:
         The /proc filesystem doesn't behave like ext2, open files can disappear
         during the read process.
         """
-        cmd_line_name = ""
-        process_dir = os.path.join(self._proc_dir, str(process_id))
-        process_info = {"pid": process_id}
+        uptime = self._uptime or sysstats.get_uptime()
+        return self._get_process_info(process_id, uptime)
 
+    def _get_process_info(self, process_id, uptime):
+        # The files of the process are opened relative to its directory, so
+        # that the full path isn't walked again for each of them.
+        try:
+            pid_fd = os.open(
+                os.path.join(self._proc_dir, str(process_id)),
+                os.O_RDONLY | os.O_DIRECTORY,
+            )
+        except OSError:
+            # The process terminated before we got to look at it.
+            return None
         try:
-            file = open(os.path.join(process_dir, "cmdline"), "r")
-            try:
-                # cmdline is a \0 separated list of strings
-                # We take the first, and then strip off the path, leaving
-                # us with the basename.
-                cmd_line = file.readline()
-                cmd_line_name = os.path.basename(cmd_line.split("\0")[0])
-            finally:
-                file.close()
-
-            file = open(os.path.join(process_dir, "status"), "r")
-            try:
-                for line in file:
-                    parts = line.split(":", 1)
-                    if parts[0] == "Name":
-                        process_info["name"] = (
-                            cmd_line_name.strip() or parts[1].strip()
-                        )
-                    elif parts[0] == "State":
-                        state = parts[1].strip()
-                        # In Lucid, capital T is used for both tracing stop
-                        # and stopped. Starting with Natty, lowercase t is
-                        # used for tracing stop.
-                        if state == "T (tracing stop)":
-                            state = state.lower()
-                        process_info["state"] = state[0].encode("ascii")
-                    elif parts[0] == "Uid":
-                        value_parts = parts[1].split()
-                        process_info["uid"] = int(value_parts[0])
-                    elif parts[0] == "Gid":
-                        value_parts = parts[1].split()
-                        process_info["gid"] = int(value_parts[0])
-                    elif parts[0] == "VmSize":
-                        value_parts = parts[1].split()
-                        process_info["vm-size"] = int(value_parts[0])
-                        break
-            finally:
-                file.close()
-
-            file = open(os.path.join(process_dir, "stat"), "r")
-            try:
-                # These variable names are lifted directly from proc(5)
-                # utime: The number of jiffies that this process has been
-                #        scheduled in user mode.
-                # stime: The number of jiffies that this process has been
-                #        scheduled in kernel mode.
-                # cutime: The number of jiffies that this process's waited-for
-                #         children have been scheduled in user mode.
-                # cstime: The number of jiffies that this process's waited-for
-                #         children have been scheduled in kernel mode.
-                parts = file.read().split()
-                start_time = int(parts[21])
-                utime = int(parts[13])
-                stime = int(parts[14])
-                uptime = self._uptime or sysstats.get_uptime()
-                pcpu = calculate_pcpu(
-                    utime,
-                    stime,
-                    uptime,
-                    start_time,
-                    self._jiffies_per_sec,
-                )
-                process_info["percent-cpu"] = pcpu
-                delta = timedelta(0, start_time // self._jiffies_per_sec)
-                if self._boot_time is None:
-                    logging.warning(
-                        "Skipping process (PID %s) without boot time.",
-                        process_id,
-                    )
-                    return None
-                process_info["start-time"] = to_timestamp(
-                    self._boot_time + delta,
-                )
-            finally:
-                file.close()
+            return self._read_process_info(process_id, pid_fd, uptime)
+        finally:
+            os.close(pid_fd)
 
+    def _read_process_info(self, process_id, pid_fd, uptime):
+        """Read the information for C{process_id} from its open C{pid_fd}."""
+        process_info = {"pid": process_id}
+        opener = partial(os.open, dir_fd=pid_fd)
+
+        try:
+            with open("cmdline", "rb", opener=opener) as file:
+                cmd_line = file.read()
+            with open("status", "rb", opener=opener) as file:
+                fields = dict(_STATUS_RE.findall(file.read()))
+            with open("stat", "rb", opener=opener) as file:
+                stat = file.read()
         except OSError:
             # Handle the race that happens when we find a process
             # which terminates before we open the stat file.
             return None
 
+        # cmdline is a \0 separated list of strings
+        # We take the first, and then strip off the path, leaving
+        # us with the basename.
+        name = os.path.basename(cmd_line.split(b"\0", 1)[0]).strip()
+        name = name or fields[b"Name"].strip()
+        process_info["name"] = name.decode("utf-8", "replace")
+        # The state is the first character of the field, the regex having
+        # already skipped the whitespace in front of it. In Lucid, capital
+        # T is used for both tracing stop and stopped. Starting with Natty,
+        # lowercase t is used for tracing stop.
+        state = fields[b"State"][:1]
+        if state == b"T" and fields[b"State"].startswith(_LUCID_TRACING_STOP):
+            state = b"t"
+        process_info["state"] = state
+        process_info["uid"] = int(fields[b"Uid"].split(None, 1)[0])
+        process_info["gid"] = int(fields[b"Gid"].split(None, 1)[0])
+        if b"VmSize" in fields:
+            vm_size = fields[b"VmSize"].split(None, 1)[0]
+            process_info["vm-size"] = int(vm_size)
+
+        # These variable names are lifted directly from proc(5)
+        # utime: The number of jiffies that this process has been
+        #        scheduled in user mode.
+        # stime: The number of jiffies that this process has been
+        #        scheduled in kernel mode.
+        # cutime: The number of jiffies that this process's waited-for
+        #         children have been scheduled in user mode.
+        # cstime: The number of jiffies that this process's waited-for
+        #         children have been scheduled in kernel mode.
+        match = _STAT_RE.match(stat, stat.rindex(b")"))
+        utime, stime, start_time = map(int, match.groups())
+        pcpu = calculate_pcpu(
+            utime,
+            stime,
+            uptime,
+            start_time,
+            self._jiffies_per_sec,
+        )
+        process_info["percent-cpu"] = pcpu
+        if self._boot_time is None:
+            logging.warning(
+                "Skipping process (PID %s) without boot time.",
+                process_id,
+            )
+            return None
+        process_info["start-time"] = (
+            self._boot_time + start_time // self._jiffies_per_sec
+        )
+
         assert (
             "pid" in process_info
             and "state" in process_info
@@ -59,9 +59,18 @@ class EventHandlingReactorMixin:
         """
         pair = (handler, priority)
 
-        handlers = self._event_handlers.setdefault(event_type, [])
-        handlers.append(pair)
-        handlers.sort(key=lambda pair: pair[1])
+        handlers = self._event_handlers.get(event_type, ())
+        # Keep the handlers sorted by priority, inserting after any handler
+        # with the same priority so that registration order is preserved. Most
+        # handlers use the default priority, so this is usually an append.
+        index = len(handlers)
+        while index and handlers[index - 1][1] > priority:
+            index -= 1
+        # The handlers are kept in a tuple that is replaced rather than
+        # modified, so that fire can iterate over it without copying it.
+        self._event_handlers[event_type] = (
+            handlers[:index] + (pair,) + handlers[index:]
+        )
 
         return EventID(event_type, pair)
 
@@ -76,19 +85,23 @@ class EventHandlingReactorMixin:
         @param kwargs: Keyword arguments to pass to the registered handlers.
         """
         logging.debug("Started firing %s.", event_type)
+        # Formatting the handlers isn't cheap, so only do it when the debug
+        # messages are actually going to be emitted.
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
         results = []
-        # Make a copy of the handlers that are registered at this point in
-        # time, so we have a stable list in case handlers are cancelled
-        # dynamically by executing the handlers themselves.
-        handlers = list(self._event_handlers.get(event_type, ()))
+        # The handlers tuple is never modified in place, so iterating over it
+        # is stable even if handlers are registered or cancelled dynamically
+        # by executing the handlers themselves.
+        handlers = self._event_handlers.get(event_type, ())
         for handler, priority in handlers:
             try:
-                logging.debug(
-                    "Calling %s for %s with priority %d.",
-                    format_object(handler),
-                    event_type,
-                    priority,
-                )
+                if debug:
+                    logging.debug(
+                        "Calling %s for %s with priority %d.",
+                        format_object(handler),
+                        event_type,
+                        priority,
+                    )
                 results.append(handler(*args, **kwargs))
             except KeyboardInterrupt:
                 logging.exception(
@@ -120,7 +133,11 @@ class EventHandlingReactorMixin:
         @param id: the L{EventID} of the handler to unregister.
         """
         if type(id) is EventID:
-            self._event_handlers[id._event_type].remove(id._pair)
+            handlers = self._event_handlers[id._event_type]
+            index = handlers.index(id._pair)
+            self._event_handlers[id._event_type] = (
+                handlers[:index] + handlers[index + 1 :]
+            )
         else:
             raise InvalidID(f"EventID instance expected, received {id!r}")
 
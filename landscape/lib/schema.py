@@ -1,8 +1,9 @@
 """A schema system. Yes. Another one!"""
-from twisted.python.compat import iteritems
 from twisted.python.compat import long
 from twisted.python.compat import unicode
 
+_MISSING = object()
+
 
 class InvalidError(Exception):
     """Raised when invalid input is received."""
@@ -36,12 +37,37 @@ class Any:
 
     def __init__(self, *schemas):
         self.schemas = schemas
+        self._fast_coerce = self._get_fast_coerce(schemas)
+
+    @staticmethod
+    def _get_fast_coerce(schemas):
+        """Map value types to the schema that is known to handle them first.
+
+        A type is only mapped to a schema if that schema accepts every value of
+        the type and no schema before it could accept any of them, so using
+        the map gives the same result as trying the schemas in order. The scan
+        stops at the first schema we know nothing about.
+        """
+        fast_coerce = {}
+        seen_types = set()
+        for schema in schemas:
+            types = _get_simple_schema_types(schema)
+            if types is None:
+                break
+            possible_types, accepted_types = types
+            for accepted_type in accepted_types - seen_types:
+                fast_coerce[accepted_type] = schema.coerce
+            seen_types.update(possible_types)
+        return fast_coerce
 
     def coerce(self, value):
         """
         The result of the first schema which doesn't raise
         L{InvalidError} from its C{coerce} method will be returned.
         """
+        fast_coerce = self._fast_coerce.get(type(value))
+        if fast_coerce is not None:
+            return fast_coerce(value)
         for schema in self.schemas:
             try:
                 return schema.coerce(value)
@@ -52,6 +78,39 @@ class Any:
         )
 
 
+def _get_simple_schema_types(schema):
+    """Return the types a simple schema may accept and those it always does.
+
+    @return: A C{(possible_types, accepted_types)} pair of sets, or C{None} if
+        C{schema} is not one of the simple schemas whose behaviour is known.
+    """
+    schema_type = type(schema)
+    if schema_type is Constant:
+        constant_type = type(schema.value)
+        if schema.value is None:
+            return {constant_type}, {constant_type}
+        if constant_type is str:
+            return {str, bytes}, set()
+        if constant_type is bytes:
+            return {bytes}, set()
+        if constant_type in (int, bool, float):
+            # These compare equal across types, e.g. 1 == 1.0 == True.
+            return {int, bool, float}, set()
+        return None
+    if schema_type is Bool:
+        return {bool}, {bool}
+    if schema_type is Int:
+        return {int, bool}, {int, bool}
+    if schema_type is Float:
+        return {int, bool, float}, {int, bool, float}
+    if schema_type is Bytes:
+        return {bytes, str}, {bytes, str}
+    if schema_type is Unicode:
+        # Bytes may fail to decode, so they're not always accepted.
+        return {bytes, str}, {str}
+    return None
+
+
 class Bool:
     """Something that must be a C{bool}."""
 
@@ -108,6 +167,8 @@ class Unicode:
         self.encoding = encoding
 
     def coerce(self, value):
+        if isinstance(value, unicode):
+            return value
         if isinstance(value, bytes):
             try:
                 value = value.decode(self.encoding)
@@ -183,34 +244,45 @@ class KeyDict:
         self.optional = set(optional)
         self.schema = schema
         self._strict = strict
+        self._required_keys = set(schema) - self.optional
+        # Walk the schema rather than the value when coercing, with the
+        # optional flag of each key worked out up front. The coerced dict
+        # has its keys in schema order as a result.
+        self._entries = tuple(
+            (key, sub_schema, key in self.optional)
+            for key, sub_schema in schema.items()
+        )
 
     def coerce(self, value):
         new_dict = {}
         if not isinstance(value, dict):
             raise InvalidError(f"{value!r} is not a dict.")
 
-        for k, v in iteritems(value):
-            unknown_key = k not in self.schema
-
-            if unknown_key and self._strict:
-                raise InvalidError(
-                    f"{k!r} is not a valid key as per {self.schema!r}",
-                )
-            elif unknown_key:
-                # We are in non-strict mode, so we ignore unknown keys.
+        schema = self.schema
+        # Unknown keys are reported before any value is coerced.
+        if self._strict and not value.keys() <= schema.keys():
+            for k in value:
+                if k not in schema:
+                    raise InvalidError(
+                        f"{k!r} is not a valid key as per {schema!r}",
+                    )
+
+        has_missing = False
+        for k, sub_schema, optional in self._entries:
+            v = value.get(k, _MISSING)
+            if v is _MISSING:
+                if not optional:
+                    has_missing = True
                 continue
-
             try:
-                new_dict[k] = self.schema[k].coerce(v)
+                new_dict[k] = sub_schema.coerce(v)
             except InvalidError as e:
                 raise InvalidError(
                     f"Value of {k!r} key of dict {value!r} could not coerce "
-                    f"with {self.schema[k]}: {e}",
+                    f"with {sub_schema}: {e}",
                 )
-        new_keys = set(new_dict.keys())
-        required_keys = set(self.schema.keys()) - self.optional
-        missing = required_keys - new_keys
-        if missing:
+        if has_missing:
+            missing = self._required_keys - new_dict.keys()
             raise InvalidError(f"Missing keys {missing}")
         return new_dict
 
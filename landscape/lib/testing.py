@@ -1,4 +1,5 @@
-import bisect
+import heapq
+import itertools
 import logging
 import os.path
 import re
@@ -591,7 +592,8 @@ CapEff: 0000000000000000
             file.close()
         if stat_data is None:
             stat_data = f"""\
-0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 {started_after_boot:d}\
+0 ({process_name[:15]}) 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 \
+{started_after_boot:d}\
 """
         filename = os.path.join(process_dir, "stat")
 
@@ -652,6 +654,7 @@ class FakeReactor(EventHandlingReactorMixin):
         super().__init__()
         self._current_time = 0
         self._calls = []
+        self._sequence = itertools.count()
         self.hosts = {}
         self._threaded_callbacks = []
 
@@ -666,18 +669,12 @@ class FakeReactor(EventHandlingReactorMixin):
 
     def call_later(self, seconds, f, *args, **kwargs):
         scheduled_time = self._current_time + seconds
-        call = (scheduled_time, f, args, kwargs)
-        self._insort_call(call)
+        # The sequence number breaks ties between calls scheduled for the
+        # same time, since the functions themselves can't be compared.
+        call = (scheduled_time, next(self._sequence), f, args, kwargs)
+        heapq.heappush(self._calls, call)
         return FakeReactorID(call)
 
-    def _insort_call(self, call):
-        # We want to insert the call in the appropriate time slot. A simple
-        # bisect.insort_left() is not sufficient as the comparison of two
-        # methods is not defined in Python 3.
-        times = [c[0] for c in self._calls]
-        index = bisect.bisect_left(times, call[0])
-        self._calls.insert(index, call)
-
     def call_every(self, seconds, f, *args, **kwargs):
         def fake():
             # update the call so that cancellation will continue
@@ -698,6 +695,7 @@ class FakeReactor(EventHandlingReactorMixin):
         if type(id) is FakeReactorID:
             if id._data in self._calls:
                 self._calls.remove(id._data)
+                heapq.heapify(self._calls)
             id.active = False
         else:
             super().cancel_call(id)
@@ -768,7 +766,7 @@ class FakeReactor(EventHandlingReactorMixin):
         while (
             self._calls and self._calls[0][0] <= self._current_time + seconds
         ):
-            call = self._calls.pop(0)
+            call = heapq.heappop(self._calls)
             # If we find a call within the time we're advancing,
             # before calling it, let's advance the time *just* to
             # when that call is expecting to be run, so that if it
@@ -777,7 +775,7 @@ class FakeReactor(EventHandlingReactorMixin):
             seconds -= call[0] - self._current_time
             self._current_time = call[0]
             try:
-                call[1](*call[2], **call[3])
+                call[2](*call[3], **call[4])
             except Exception as e:
                 logging.exception(e)
         self._current_time += seconds
@@ -39,44 +39,38 @@ class ProcessInfoTest(testing.FSTestCase, unittest.TestCase):
         create_text_file(os.path.join(process_dir, "status"), status)
 
         stat_array = [str(index) for index in range(44)]
+        stat_array[1] = "(foo)"
         stat = " ".join(stat_array)
         create_text_file(os.path.join(process_dir, "stat"), stat)
 
     @mock.patch("landscape.lib.process.detect_jiffies", return_value=1)
-    @mock.patch("os.listdir")
     @mock.patch("landscape.lib.sysstats.get_uptime")
-    def test_missing_process_race(
-        self,
-        get_uptime_mock,
-        list_dir_mock,
-        jiffies_mock,
-    ):
+    def test_missing_process_race(self, get_uptime_mock, jiffies_mock):
         """
-        We use os.listdir("/proc") to get the list of active processes, if a
-        process ends before we attempt to read the process' information, then
-        this should not trigger an error.
+        We scan /proc to get the list of active processes, if a process ends
+        before we attempt to read the process' information, then this should
+        not trigger an error.
         """
 
         class FakeFile:
-            def __init__(self, response=""):
+            def __init__(self, response=b""):
                 self._response = response
                 self.closed = False
 
-            def readline(self):
-                return self._response
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                self.closed = True
 
-            def __iter__(self):
+            def read(self):
                 if self._response is None:
                     raise OSError("Fake file error")
-                else:
-                    yield self._response
-
-            def close(self):
-                self.closed = True
+                return self._response
 
-        list_dir_mock.return_value = ["12345"]
+        os.mkdir(os.path.join(self.proc_dir, "12345"))
         get_uptime_mock.return_value = 1.0
-        fakefile1 = FakeFile("test-binary")
+        fakefile1 = FakeFile(b"test-binary")
         fakefile2 = FakeFile(None)
         with mock.patch(
             "landscape.lib.process.open",
@@ -85,18 +79,105 @@ class ProcessInfoTest(testing.FSTestCase, unittest.TestCase):
         ) as open_mock:
             # This means "return fakefile1, then fakefile2"
             open_mock.side_effect = [fakefile1, fakefile2]
-            process_info = ProcessInformation("/proc")
+            process_info = ProcessInformation(self.proc_dir)
             processes = list(process_info.get_all_process_info())
             calls = [
-                mock.call("/proc/12345/cmdline", "r"),
-                mock.call("/proc/12345/status", "r"),
+                mock.call("cmdline", "rb", opener=mock.ANY),
+                mock.call("status", "rb", opener=mock.ANY),
             ]
             open_mock.assert_has_calls(calls)
         self.assertEqual(processes, [])
-        list_dir_mock.assert_called_with("/proc")
         self.assertTrue(fakefile1.closed)
         self.assertTrue(fakefile2.closed)
 
+    def test_get_process_info_missing_process(self):
+        """
+        C{get_process_info} returns C{None} for a process which isn't there,
+        for example because it terminated after /proc was listed.
+        """
+        process_info = ProcessInformation(self.proc_dir)
+        self.assertIsNone(process_info.get_process_info(12))
+
+    def test_missing_proc_dir(self):
+        """
+        Creating a L{ProcessInformation} doesn't touch the proc directory, so
+        it works even if the directory doesn't exist.
+        """
+        proc_dir = os.path.join(self.proc_dir, "missing")
+        process_info = ProcessInformation(proc_dir, jiffies=1, boot_time=0)
+        self.assertIsNone(process_info.get_process_info(12))
+
+    @mock.patch("landscape.lib.sysstats.get_uptime", return_value=100.0)
+    def test_get_process_info_command_name_with_spaces(self, uptime_mock):
+        """
+        The command name in the stat file can contain spaces and
+        parentheses, which don't shift the fields following it.
+        """
+        self._add_process_info(12)
+        stat_array = [str(index) for index in range(44)]
+        stat_array[1] = "(Web Content (1))"
+        create_text_file(
+            os.path.join(self.proc_dir, "12", "stat"),
+            " ".join(stat_array),
+        )
+        process_info = ProcessInformation(
+            self.proc_dir,
+            jiffies=1,
+            boot_time=1000,
+        )
+        info = process_info.get_process_info(12)
+        self.assertEqual(1021, info["start-time"])
+        self.assertEqual(
+            calculate_pcpu(13, 14, 100.0, 21, 1),
+            info["percent-cpu"],
+        )
+
+    @mock.patch("landscape.lib.sysstats.get_uptime", return_value=100.0)
+    def test_get_all_process_info(self, uptime_mock):
+        """
+        C{get_all_process_info} yields the information of every process
+        in the proc directory, skipping other entries, and only reads the
+        uptime once for the whole scan.
+        """
+        self._add_process_info(12)
+        self._add_process_info(13)
+        os.mkdir(os.path.join(self.proc_dir, "self"))
+        process_info = ProcessInformation(
+            self.proc_dir,
+            jiffies=1,
+            boot_time=1000,
+        )
+        processes = process_info.get_all_process_info()
+        self.assertEqual(
+            [12, 13],
+            sorted(process["pid"] for process in processes),
+        )
+        uptime_mock.assert_called_once_with()
+
+    @mock.patch("landscape.lib.sysstats.get_uptime", return_value=100.0)
+    def test_get_all_process_info_overlapping_scans(self, uptime_mock):
+        """
+        A scan started while another one on the same L{ProcessInformation}
+        is still in progress sees all the processes.
+        """
+        self._add_process_info(12)
+        self._add_process_info(13)
+        process_info = ProcessInformation(
+            self.proc_dir,
+            jiffies=1,
+            boot_time=1000,
+        )
+        first_scan = process_info.get_all_process_info()
+        next(first_scan)
+        self.assertEqual(
+            [12, 13],
+            sorted(
+                process["pid"]
+                for process in process_info.get_all_process_info()
+            ),
+        )
+        self.assertEqual(1, len(list(first_scan)))
+
     def test_get_process_info_state(self):
         """
         C{get_process_info} reads the process state from the status file
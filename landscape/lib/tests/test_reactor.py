@@ -1,6 +1,8 @@
+import logging
 import time
 import types
 import unittest
+from unittest import mock
 
 from landscape.lib import testing
 from landscape.lib.compat import thread
@@ -9,6 +11,22 @@ from landscape.lib.testing import FakeReactor
 
 
 class ReactorTestMixin:
+    def run_until(self, reactor, condition, timeout=0.7):
+        """Run C{reactor} until C{condition()} is true or C{timeout} expires.
+
+        This lets tests waiting on work done in a thread stop as soon as the
+        results are back, instead of always running for the whole timeout.
+        """
+
+        def check():
+            if condition():
+                reactor.cancel_call(call)
+                reactor.stop()
+
+        call = reactor.call_every(0.01, check)
+        reactor.call_later(timeout, reactor.stop)
+        reactor.run()
+
     def test_call_later(self):
         reactor = self.get_reactor()
         called = []
@@ -185,6 +203,20 @@ class ReactorTestMixin:
         reactor.fire("foobar")
         self.assertEqual(called, [3, 4, 5])
 
+    def test_event_same_priority(self):
+        """
+        Event callbacks with the same priority are run in the order they were
+        registered.
+        """
+        reactor = self.get_reactor()
+        called = []
+        reactor.call_on("foobar", lambda: called.append("a"), priority=1)
+        reactor.call_on("foobar", lambda: called.append("b"))
+        reactor.call_on("foobar", lambda: called.append("c"), priority=1)
+        reactor.call_on("foobar", lambda: called.append("d"))
+        reactor.fire("foobar")
+        self.assertEqual(called, ["b", "d", "a", "c"])
+
     def test_default_priority(self):
         """
         The default priority of an event callback should be 0.
@@ -224,6 +256,36 @@ class ReactorTestMixin:
             self.logfile.getvalue(),
         )
 
+    def test_fire_logs_handlers_at_debug_level(self):
+        """
+        When debug messages are being emitted, firing an event logs the name
+        of each handler that gets called.
+        """
+        reactor = self.get_reactor()
+
+        def handle_one():
+            pass
+
+        reactor.call_on("foobar", handle_one)
+        reactor.fire("foobar")
+        self.assertIn("Calling", self.logfile.getvalue())
+        self.assertIn("handle_one", self.logfile.getvalue())
+
+    def test_fire_without_debug_logging(self):
+        """
+        Handlers aren't formatted for the debug log if debug messages aren't
+        being emitted.
+        """
+        self.logger.setLevel(logging.INFO)
+        reactor = self.get_reactor()
+        called = []
+        reactor.call_on("foobar", lambda: called.append(True))
+        with mock.patch("landscape.lib.reactor.format_object") as format_mock:
+            reactor.fire("foobar")
+        self.assertEqual([True], called)
+        format_mock.assert_not_called()
+        self.assertNotIn("Calling", self.logfile.getvalue())
+
     def test_weird_event_type(self):
         # This can be useful for "namespaced" event types
         reactor = self.get_reactor()
@@ -271,8 +333,7 @@ class ReactorTestMixin:
 
         reactor.call_in_thread(None, None, f, 1, 2, c=3)
 
-        reactor.call_later(0.7, reactor.stop)
-        reactor.run()
+        self.run_until(reactor, lambda: len(called) == 2)
 
         self.assertEqual(len(called), 2)
         self.assertEqual(called[0], (1, 2, 3))
@@ -299,8 +360,7 @@ class ReactorTestMixin:
 
         reactor.call_in_thread(callback, errback, f)
 
-        reactor.call_later(0.7, reactor.stop)
-        reactor.run()
+        self.run_until(reactor, lambda: len(called) == 3)
 
         self.assertEqual(called, ["f", "callback", 32])
 
@@ -323,8 +383,7 @@ class ReactorTestMixin:
 
         reactor.call_in_thread(callback, errback, f)
 
-        reactor.call_later(0.7, reactor.stop)
-        reactor.run()
+        self.run_until(reactor, lambda: len(called) == 3)
 
         self.assertEqual(called[:2], ["f", "errback"])
         self.assertEqual(len(called), 3)
@@ -348,8 +407,10 @@ class ReactorTestMixin:
 
         reactor.call_in_thread(callback, None, f)
 
-        reactor.call_later(0.7, reactor.stop)
-        reactor.run()
+        self.run_until(
+            reactor,
+            lambda: "ZeroDivisionError" in self.logfile.getvalue(),
+        )
 
         self.assertEqual(called, ["f"])
         self.assertTrue(
@@ -373,8 +434,7 @@ class ReactorTestMixin:
 
         reactor.call_in_thread(None, None, f)
 
-        reactor.call_later(0.7, reactor.stop)
-        reactor.run()
+        self.run_until(reactor, lambda: len(called) == 4)
 
         self.assertEqual(len(called), 4)
         self.assertEqual(called[0], "f")
@@ -440,6 +500,21 @@ class FakeReactorTest(
         reactor.advance(3)
         self.assertEqual(reactor.time(), 13.5)
 
+    def test_calls_at_same_time_run_in_scheduling_order(self):
+        """
+        Calls scheduled for the same time are run in the order they were
+        scheduled, also after some other call has been cancelled.
+        """
+        reactor = self.get_reactor()
+        called = []
+        reactor.call_later(1, called.append, "first")
+        call = reactor.call_later(0.5, called.append, "cancelled")
+        reactor.call_later(1, called.append, "second")
+        reactor.call_later(1, called.append, "third")
+        reactor.cancel_call(call)
+        reactor.advance(1)
+        self.assertEqual(["first", "second", "third"], called)
+
 
 class EventHandlingReactorTest(
     testing.HelperTestCase,
@@ -31,6 +31,18 @@ class BasicTypesTest(unittest.TestCase):
         schema = Any(Constant(None), Unicode())
         self.assertRaises(InvalidError, schema.coerce, object())
 
+    def test_any_first_matching_schema_wins(self):
+        """
+        L{Any} returns the result of the first schema that accepts the value,
+        also when it knows upfront which schema handles a given type.
+        """
+        self.assertEqual(Any(Unicode(), Constant(None)).coerce(None), None)
+        self.assertEqual(Any(Unicode(), Constant(None)).coerce(b"foo"), "foo")
+        self.assertEqual(Any(Unicode(), Bytes()).coerce(b"\xff"), b"\xff")
+        self.assertIs(Any(Constant(1), Bool()).coerce(True), True)
+        self.assertIs(Any(Constant(1), Bool()).coerce(False), False)
+        self.assertEqual(Any(Bool(), Int()).coerce(1), 1)
+
     def test_constant(self):
         self.assertEqual(Constant("hello").coerce("hello"), "hello")
 
@@ -168,6 +180,34 @@ class BasicTypesTest(unittest.TestCase):
     def test_key_dict_unknown_key(self):
         self.assertRaises(InvalidError, KeyDict({}).coerce, {"foo": 1})
 
+    def test_key_dict_unknown_key_with_known_keys(self):
+        schema = KeyDict({"foo": Int(), "bar": Int()}, optional=["bar"])
+        self.assertRaises(InvalidError, schema.coerce, {"foo": 1, "baz": 2})
+
+    def test_key_dict_unknown_key_reported_before_bad_value(self):
+        """
+        An unknown key is reported even if the value of a known key doesn't
+        coerce, wherever the two keys are in the dict.
+        """
+        schema = KeyDict({"foo": Int()})
+        for value in ({"foo": "x", "bar": 1}, {"bar": 1, "foo": "x"}):
+            with self.assertRaises(InvalidError) as context:
+                schema.coerce(value)
+            self.assertIn("'bar' is not a valid key", str(context.exception))
+
+    def test_key_dict_bad_value_reported_before_missing_keys(self):
+        schema = KeyDict({"foo": Int(), "bar": Int()})
+        with self.assertRaises(InvalidError) as context:
+            schema.coerce({"foo": "x"})
+        self.assertIn("Value of 'foo' key", str(context.exception))
+
+    def test_key_dict_coerced_keys_in_schema_order(self):
+        schema = KeyDict({"foo": Int(), "bar": Int()})
+        self.assertEqual(
+            ["foo", "bar"],
+            list(schema.coerce({"bar": 2, "foo": 1})),
+        )
+
     def test_key_dict_unknown_key_not_strict(self):
         self.assertEqual(
             KeyDict({"foo": Int()}, strict=False).coerce({"foo": 1, "bar": 2}),
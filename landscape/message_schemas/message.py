@@ -30,14 +30,7 @@ class Message(KeyDict):
             optional.extend(["timestamp", "api"])
         else:
             optional = ["timestamp", "api"]
-        super().__init__(schema, optional=optional)
-
-    def coerce(self, value):
-        for k in list(value.keys()):
-            if k not in self.schema:
-                # We don't know about this field, just discard it. This
-                # is useful when a client that introduced some new field
-                # in a message talks to an older server, that don't understand
-                # the new field yet.
-                value.pop(k)
-        return super().coerce(value)
+        # Unknown fields are discarded rather than rejected. This is useful
+        # when a client that introduced some new field in a message talks
+        # to an older server, that doesn't understand the new field yet.
+        super().__init__(schema, optional=optional, strict=False)
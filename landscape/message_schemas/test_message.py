@@ -65,3 +65,12 @@ class MessageTest(unittest.TestCase):
             {"type": "foo"},
             schema.coerce({"type": "foo", "crap": 123}),
         )
+
+    def test_with_unknown_fields_leaves_value_untouched(self):
+        """
+        Discarding unknown fields doesn't modify the value being coerced.
+        """
+        schema = Message("foo", {})
+        value = {"type": "foo", "crap": 123}
+        schema.coerce(value)
+        self.assertEqual({"type": "foo", "crap": 123}, value)
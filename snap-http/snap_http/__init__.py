@@ -0,0 +1,81 @@
+from .api import (
+    check_change,
+    check_changes,
+    enable,
+    enable_all,
+    disable,
+    disable_all,
+    hold,
+    hold_all,
+    install,
+    install_all,
+    sideload,
+    refresh,
+    refresh_all,
+    revert,
+    revert_all,
+    remove,
+    remove_all,
+    snapshots,
+    forget_snapshot,
+    save_snapshot,
+    switch,
+    switch_all,
+    unhold,
+    unhold_all,
+    logs,
+    list,
+    list_all,
+    get_conf,
+    set_conf,
+    get_confdb,
+    set_confdb,
+    delegate_confdb,
+    undelegate_confdb,
+    get_connections,
+    get_interfaces,
+    connect_interface,
+    disconnect_interface,
+    get_model,
+    remodel,
+    get_validation_set,
+    get_validation_sets,
+    refresh_validation_set,
+    monitor_validation_set,
+    get_recovery_systems,
+    get_recovery_system,
+    perform_system_action,
+    perform_recovery_action,
+    enforce_validation_set,
+    forget_validation_set,
+    get_assertion_types,
+    get_assertions,
+    add_assertion,
+    list_users,
+    add_user,
+    remove_user,
+    get_apps,
+    start,
+    start_all,
+    stop,
+    stop_all,
+    restart,
+    restart_all,
+    get_keyslots,
+    generate_recovery_key,
+    update_recovery_key,
+)
+
+from .http import SnapdHttpException
+
+from .types import (
+    COMPLETE_STATUSES,
+    INCOMPLETE_STATUSES,
+    SUCCESS_STATUSES,
+    ERROR_STATUSES,
+    SnapdResponse,
+    FormData,
+    JsonData,
+    AssertionData,
+    FileUpload,
+)